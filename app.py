@@ -5,321 +5,586 @@ GitHub + Render Deployment Ready
 Professional trading signal delivery system
 """
 
-from flask import Flask, request, jsonify
-import requests
+# Patch the stdlib before anything else imports it so outbound sockets yield to gevent
+from gevent import monkey
+monkey.patch_all()
+
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from werkzeug.exceptions import RequestEntityTooLarge
+import msgspec
+import orjson
+import urllib3
+from urllib3.util import Retry
 import json
 import logging
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock, Timer
 from datetime import datetime
+from functools import lru_cache
+from typing import Union
+import atexit
 import os
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 20+ digit runs may not fit orjson's 64-bit integers
+_WIDE_NUMBER = re.compile(rb'\d{20}')
+
+def _dumps_bytes(obj):
+    """Encode with orjson, falling back to the stdlib for integers wider than 64 bits"""
+    try:
+        return orjson.dumps(obj)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson for faster encoding and decoding"""
+    
+    def dumps(self, obj, **kwargs):
+        return _dumps_bytes(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        if isinstance(s, str):
+            s = s.encode()
+        # orjson turns integers wider than 64 bits into floats; keep them exact via the stdlib
+        if _WIDE_NUMBER.search(s):
+            return json.loads(s)
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response, skipping the str round trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(_dumps_bytes(obj), mimetype="application/json")
+
 app = Flask(__name__)
+app.json_provider_class = OrjsonProvider
+app.json = OrjsonProvider(app)
+
+# Compress the larger JSON bodies such as /; small /signal acks stay uncompressed
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
+
+# Signals are well under 1KB - refuse larger bodies before they are read or parsed
+MAX_SIGNAL_BYTES = 8 * 1024
+app.config['MAX_CONTENT_LENGTH'] = MAX_SIGNAL_BYTES
 
 # Telegram API configuration
 TELEGRAM_API_URL = "https://api.telegram.org/bot{}/sendMessage"
 
-def format_signal(data):
-    """Format trading signal for Telegram - Professional Layout"""
-    
-    signal_type = data.get('signal_type', 'UNKNOWN')
-    symbol = data.get('symbol', 'UNKNOWN')
-    entry_price = data.get('entry_price', 0)
-    tp_price = data.get('tp_price', 0)
-    sl_price = data.get('sl_price', 0)
-    confidence = data.get('confidence', 0)
-    signal_category = data.get('signal_category', 'SIGNAL')
-    timestamp = data.get('timestamp', datetime.now().timestamp())
-    
-    # Convert timestamp to readable format
-    if isinstance(timestamp, (int, float)):
-        dt = datetime.fromtimestamp(timestamp)
-    else:
-        dt = datetime.now()
+@lru_cache(maxsize=64)
+def _url_for(token):
+    """sendMessage URL for a bot token, built once per token"""
+    return TELEGRAM_API_URL.format(token)
+
+# Shared HTTP pool - keeps the TLS connection to Telegram alive between signals
+_http = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=32,
+    retries=Retry(
+        total=3,
+        read=0,  # sendMessage is not idempotent - a slow answer may already be delivered
+        backoff_factor=0.3,
+        # No 429 and no Retry-After: urllib3 would sleep out Telegram's flood wait in full,
+        # which can be minutes. The token buckets pace sends and a 429 is logged instead
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["POST"]),
+        respect_retry_after_header=False,
+        raise_on_status=False  # Hand back the last response so Telegram's error is reported
+    )
+)
+_TIMEOUT = urllib3.Timeout(connect=3.05, read=12)
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def _build_body(chat_id, text):
+    """Encode a sendMessage request - plain text, no parse_mode, no link previews"""
+    return orjson.dumps({'chat_id': chat_id, 'text': text, 'disable_web_page_preview': True})
+
+# Background sender - Telegram delivery runs off the request path
+_executor = ThreadPoolExecutor(max_workers=25, thread_name_prefix="tg-send")
+_send_slots = BoundedSemaphore(64)  # Max signals queued or in flight
+atexit.register(_executor.shutdown)
+
+class TokenBucket:
+    """Token bucket - callers wait for a slot instead of being rejected"""
     
-    time_str = dt.strftime("%H:%M:%S")
-    date_str = dt.strftime("%Y.%m.%d")
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = Lock()
     
-    # Signal indicator
-    signal_indicator = "BUY SIGNAL" if signal_type == "BUY" else "SELL SIGNAL"
+    def reserve(self):
+        """Claim the next slot and return how many seconds until it is usable"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
     
-    # Create professional message format
-    message = f"""KAROOSPIKES PREMIUM SIGNALS
-{'-' * 35}
-
-{signal_indicator}
+    def acquire(self):
+        time.sleep(self.reserve())
 
-{signal_category}
+# Telegram rate limits - ~30 msg/s per bot, ~1 msg/s per chat with short bursts
+_BOT_RATE, _BOT_BURST = 25, 25
+_CHAT_RATE, _CHAT_BURST = 1, 3
+_MAX_BUCKETS = 1024  # Per map - /signal is unauthenticated, so keep only recent keys
+_bot_buckets = OrderedDict()
+_chat_buckets = OrderedDict()
+_buckets_lock = Lock()
 
-{signal_type} {symbol}
+def _bucket_for(buckets, key, rate, burst):
+    """Fetch or create the rate limiter for a bot token or chat, evicting the least recent"""
+    with _buckets_lock:
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = TokenBucket(rate, burst)
+            if len(buckets) > _MAX_BUCKETS:
+                buckets.popitem(last=False)
+        else:
+            buckets.move_to_end(key)
+    return bucket
 
-Entry: {entry_price:.5f}
-Take Profit: {tp_price:.5f}
-Stop Loss: {sl_price:.5f}
+class Signal(msgspec.Struct):
+    """Trading signal payload posted by MT5"""
+    signal_type: str
+    symbol: str
+    entry_price: float
+    tp_price: float
+    sl_price: float
+    bot_token: str
+    confidence: Union[int, float] = 0
+    signal_category: str = 'SIGNAL'
+    timestamp: Union[float, str, None] = None
+    channel_id: Union[int, str, None] = None
+    chat_id: Union[int, str, None] = None
 
-Confidence: {confidence}%
-Time: {date_str} {time_str}
+# Parses, type-checks and coerces numeric strings in one pass
+_signal_decoder = msgspec.json.Decoder(Signal, strict=False)
 
-Professional Trading Signals
-Support: @KaroospikesSupport
-Risk Warning: Trading involves risk
-Powered by Karoospikes
+# Signal message layout - built once per process
+_DASH = '-' * 35
+_BUY_IND = "BUY SIGNAL"
+_SELL_IND = "SELL SIGNAL"
+_INDICATORS = {'BUY': _BUY_IND, 'SELL': _SELL_IND}
+_DATE_FMT = "%Y.%m.%d"
+_TIME_FMT = "%H:%M:%S"
+_TEMPLATE = (
+    "KAROOSPIKES PREMIUM SIGNALS\n"
+    "{dash}\n"
+    "\n"
+    "{indicator}\n"
+    "\n"
+    "{category}\n"
+    "\n"
+    "{stype} {symbol}\n"
+    "\n"
+    "Entry: {entry:.5f}\n"
+    "Take Profit: {tp:.5f}\n"
+    "Stop Loss: {sl:.5f}\n"
+    "\n"
+    "Confidence: {conf}%\n"
+    "Time: {date} {time}\n"
+    "\n"
+    "Professional Trading Signals\n"
+    "Support: @KaroospikesSupport\n"
+    "Risk Warning: Trading involves risk\n"
+    "Powered by Karoospikes\n"
+    "\n"
+    "{dash}"
+)
 
-{'-' * 35}"""
+def format_signal(signal):
+    """Format trading signal for Telegram - Professional Layout"""
     
-    return message
+    # Convert timestamp to readable format
+    timestamp = signal.timestamp
+    tm = time.localtime(timestamp) if isinstance(timestamp, float) else time.localtime()
+    
+    return _TEMPLATE.format_map({
+        'dash': _DASH,
+        'indicator': _INDICATORS.get(signal.signal_type, _SELL_IND),
+        'category': signal.signal_category,
+        'stype': signal.signal_type,
+        'symbol': signal.symbol,
+        'entry': signal.entry_price,
+        'tp': signal.tp_price,
+        'sl': signal.sl_price,
+        'conf': signal.confidence,
+        'date': time.strftime(_DATE_FMT, tm),
+        'time': time.strftime(_TIME_FMT, tm)
+    })
 
 def send_to_telegram(bot_token, message, chat_id="5741240579"):
     """Send message to Telegram with comprehensive error handling"""
     
-    url = TELEGRAM_API_URL.format(bot_token)
-    
-    payload = {
-        'chat_id': chat_id,
-        'text': message,
-        'disable_web_page_preview': True,
-        'parse_mode': None  # Use plain text to avoid formatting issues
-    }
+    url = _url_for(bot_token)
     
     try:
-        response = requests.post(url, json=payload, timeout=15)
-        response.raise_for_status()
+        response = _http.request(
+            "POST", url,
+            body=_build_body(chat_id, message),
+            headers=_JSON_HEADERS,
+            timeout=_TIMEOUT
+        )
+        
+        # Telegram answers successes with a fixed prefix - skip parsing them
+        body = response.data
+        if body.startswith(b'{"ok":true'):
+            logger.info("Signal sent successfully to %s", chat_id)
+            return True, "Success"
         
-        result = response.json()
+        result = orjson.loads(body)
         if result.get('ok'):
-            logger.info(f"✅ Signal sent successfully to {chat_id}")
+            logger.info("Signal sent successfully to %s", chat_id)
             return True, "Success"
         else:
             error_msg = result.get('description', 'Unknown Telegram error')
-            logger.error(f"❌ Telegram API error: {error_msg}")
+            if response.status == 429:
+                logger.error("Telegram rate limit hit, Retry-After: %s", response.headers.get('Retry-After'))
+            logger.error("Telegram API error: %s", error_msg)
             return False, error_msg
             
-    except requests.exceptions.Timeout:
-        error_msg = "Request timeout"
-        logger.error(f"❌ Timeout error: {error_msg}")
+    except orjson.JSONDecodeError:
+        error_msg = f"Invalid response from Telegram (HTTP {response.status})"
+        logger.error("Telegram API error: %s", error_msg)
         return False, error_msg
-    except requests.exceptions.RequestException as e:
-        error_msg = f"Network error: {str(e)}"
-        logger.error(f"❌ Network error: {error_msg}")
+    except urllib3.exceptions.HTTPError as e:
+        # Retries wrap the underlying failure in MaxRetryError; NewConnectionError
+        # subclasses ConnectTimeoutError in urllib3 2.x, so rule it out first
+        reason = getattr(e, 'reason', e)
+        if (isinstance(reason, urllib3.exceptions.TimeoutError)
+                and not isinstance(reason, urllib3.exceptions.NewConnectionError)):
+            error_msg = "Request timeout"
+            logger.error("Timeout error: %s", error_msg)
+        else:
+            error_msg = f"Network error: {str(e)}"
+            logger.error("Network error: %s", error_msg)
         return False, error_msg
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
-        logger.error(f"❌ Unexpected error: {error_msg}")
+        logger.error("Unexpected error: %s", error_msg)
         return False, error_msg
 
+def deliver_signal(bot_token, message, chat_id):
+    """Background worker - send a queued signal and free its queue slot"""
+    try:
+        # Per-chat pacing happened before queueing; wait out the per-bot limit here
+        _bucket_for(_bot_buckets, bot_token, _BOT_RATE, _BOT_BURST).acquire()
+        success, error_msg = send_to_telegram(bot_token, message, chat_id)
+        if success:
+            logger.info("Signal processing completed successfully")
+        else:
+            logger.error("Failed to send signal to Telegram: %s", error_msg)
+    finally:
+        _send_slots.release()
+
+def dispatch_signal(bot_token, message, chat_id):
+    """Hand a signal to the sender pool, freeing its queue slot if that fails"""
+    try:
+        _executor.submit(deliver_signal, bot_token, message, chat_id)
+    except Exception:
+        _send_slots.release()
+        raise
+
+# Signals waiting on their chat's rate limit - {key: (timer, args)}
+_pending_signals = {}
+_pending_lock = Lock()
+
+def _dispatch_or_log(args):
+    """Dispatch a paced signal, logging it if it can no longer be sent"""
+    try:
+        dispatch_signal(*args)
+    except Exception as e:
+        logger.error("Dropped queued signal for chat %s: %s", args[2], e)
+
+def _run_pending(key):
+    """Timer callback - dispatch a paced signal unless shutdown already took it"""
+    with _pending_lock:
+        entry = _pending_signals.pop(key, None)
+    if entry is not None:
+        _dispatch_or_log(entry[1])
+
+def schedule_signal(bot_token, message, chat_id):
+    """Queue a signal once its chat's rate limit allows it, without holding a sender worker"""
+    # Same chat must share one bucket whether MT5 sent the id as a number or a string
+    delay = _bucket_for(_chat_buckets, str(chat_id), _CHAT_RATE, _CHAT_BURST).reserve()
+    if delay > 0:
+        key = object()
+        timer = Timer(delay, _run_pending, (key,))
+        timer.daemon = True
+        with _pending_lock:
+            _pending_signals[key] = (timer, (bot_token, message, chat_id))
+        try:
+            timer.start()
+        except Exception:
+            with _pending_lock:
+                _pending_signals.pop(key, None)
+            _send_slots.release()
+            raise
+    else:
+        dispatch_signal(bot_token, message, chat_id)
+
+def flush_pending_signals():
+    """On exit, send paced signals that are still waiting so a worker restart does not lose them"""
+    with _pending_lock:
+        entries = list(_pending_signals.values())
+        _pending_signals.clear()
+    if entries:
+        logger.info("Flushing %d rate-limited signals before shutdown", len(entries))
+    for timer, args in entries:
+        timer.cancel()
+        # The executor stops taking work before atexit handlers run, so send inline
+        try:
+            deliver_signal(*args)
+        except Exception as e:
+            logger.error("Dropped queued signal for chat %s: %s", args[2], e)
+
+atexit.register(flush_pending_signals)
+
 @app.route('/signal', methods=['POST'])
 def receive_signal():
     """Main webhook endpoint for trading signals from MT5"""
     
+    if (request.content_length or 0) > MAX_SIGNAL_BYTES:
+        logger.error("Signal payload too large: %d bytes", request.content_length)
+        return Response(_TOO_LARGE_JSON, status=413, mimetype='application/json')
+    
     try:
-        # Get JSON data from MT5
-        data = request.get_json()
+        # Parse and validate the MT5 payload in a single pass
+        body = request.get_data()
         
-        if not data:
-            logger.warning("⚠️ No JSON data received")
+        if not body:
+            logger.warning("No JSON data received")
             return jsonify({'status': 'error', 'message': 'No data received'}), 400
         
-        logger.info(f"📨 Signal received from MT5: {data.get('signal_type', 'UNKNOWN')} {data.get('symbol', 'UNKNOWN')}")
-        
-        # Validate required fields
-        required_fields = ['signal_type', 'symbol', 'entry_price', 'tp_price', 'sl_price', 'bot_token']
-        missing_fields = [field for field in required_fields if field not in data or data[field] is None]
+        try:
+            signal = _signal_decoder.decode(body)
+        except msgspec.ValidationError as e:
+            logger.error("Invalid signal data: %s", e)
+            return jsonify({'status': 'error', 'message': f'Invalid signal data: {str(e)}'}), 400
         
-        if missing_fields:
-            logger.error(f"❌ Missing required fields: {missing_fields}")
-            return jsonify({
-                'status': 'error', 
-                'message': f'Missing required fields: {missing_fields}'
-            }), 400
+        logger.info("Signal received from MT5: %s %s", signal.signal_type, signal.symbol)
         
         # FIXED: More flexible bot token validation
-        bot_token = str(data.get('bot_token', '')).strip()
+        bot_token = signal.bot_token.strip()
         if not bot_token or len(bot_token) < 10:
-            logger.error(f"❌ Invalid bot token - too short: {len(bot_token)} characters")
+            logger.error("Invalid bot token - too short: %d characters", len(bot_token))
             return jsonify({'status': 'error', 'message': 'Bot token too short'}), 400
         
         # Check for basic bot token format (should have colon)
         if ':' not in bot_token:
-            logger.error(f"❌ Invalid bot token format - missing colon")
+            logger.error("Invalid bot token format - missing colon")
             return jsonify({'status': 'error', 'message': 'Invalid bot token format'}), 400
         
-        logger.info(f"✅ Bot token validation passed: {bot_token[:10]}...{bot_token[-4:]}")
+        logger.info("Bot token validation passed: %s...%s", bot_token[:10], bot_token[-4:])
         
         # Validate price data
         try:
-            entry_price = float(data.get('entry_price', 0))
-            tp_price = float(data.get('tp_price', 0))
-            sl_price = float(data.get('sl_price', 0))
-            confidence = int(data.get('confidence', 0))
+            confidence = int(signal.confidence)
             
-            if entry_price <= 0 or tp_price <= 0 or sl_price <= 0:
+            if signal.entry_price <= 0 or signal.tp_price <= 0 or signal.sl_price <= 0:
                 raise ValueError("Prices must be positive")
             
             if confidence < 0 or confidence > 100:
                 raise ValueError("Confidence must be between 0-100")
                 
-        except (ValueError, TypeError) as e:
-            logger.error(f"❌ Invalid numeric data: {e}")
+        except (ValueError, OverflowError) as e:
+            logger.error("Invalid numeric data: %s", e)
             return jsonify({'status': 'error', 'message': f'Invalid numeric data: {str(e)}'}), 400
         
         # Format the signal message
-        message = format_signal(data)
-        logger.info(f"📝 Message formatted, length: {len(message)} characters")
+        message = format_signal(signal)
+        logger.info("Message formatted, length: %d characters", len(message))
         
         # Determine chat destination - default to your user ID
-        chat_id = data.get('channel_id', data.get('chat_id', '5741240579'))
+        chat_id = signal.channel_id or signal.chat_id or '5741240579'
         
-        # Send to Telegram
-        logger.info(f"📤 Sending to Telegram chat: {chat_id}")
-        success, error_msg = send_to_telegram(bot_token, message, chat_id)
+        # Queue for Telegram delivery - reject when the send queue is saturated
+        if not _send_slots.acquire(blocking=False):
+            logger.error("Send queue full, rejecting signal")
+            return jsonify({'status': 'error', 'message': 'Server busy, please retry'}), 503
         
-        if success:
-            logger.info("✅ Signal processing completed successfully")
-            return jsonify({
-                'status': 'success', 
-                'message': 'Signal sent to Telegram successfully',
-                'signal_type': data.get('signal_type'),
-                'symbol': data.get('symbol'),
-                'confidence': confidence,
-                'chat_id': chat_id
-            }), 200
-        else:
-            logger.error(f"❌ Failed to send signal to Telegram: {error_msg}")
-            return jsonify({
-                'status': 'error', 
-                'message': f'Failed to send signal to Telegram: {error_msg}'
-            }), 500
+        logger.info("Queueing for Telegram chat: %s", chat_id)
+        schedule_signal(bot_token, message, chat_id)
+        
+        return jsonify({
+            'status': 'queued',
+            'message': 'Signal queued for Telegram delivery',
+            'signal_type': signal.signal_type,
+            'symbol': signal.symbol,
+            'confidence': confidence,
+            'chat_id': chat_id
+        }), 202
             
-    except json.JSONDecodeError:
-        logger.error("❌ Invalid JSON data received")
+    except msgspec.DecodeError:
+        logger.error("Invalid JSON data received")
         return jsonify({'status': 'error', 'message': 'Invalid JSON format'}), 400
+    except RequestEntityTooLarge:
+        raise  # Answered by the 413 handler
     except Exception as e:
-        logger.error(f"❌ Unexpected server error: {str(e)}")
+        logger.error("Unexpected server error: %s", e)
         return jsonify({'status': 'error', 'message': 'Internal server error'}), 500
 
+# Serialized /health body, refreshed at most once per second
+_HEALTH_TTL = 1.0
+_health_cache = [0.0, None]  # [monotonic time built, JSON bytes]
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for monitoring"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'Karoospikes Webhook Server',
-        'version': '2.1.0',
-        'timestamp': datetime.now().isoformat(),
-        'uptime': 'Running',
-        'bot_token_validation': 'Fixed'
-    })
+    now = time.monotonic()
+    built_at, body = _health_cache
+    if body is None or now - built_at > _HEALTH_TTL:
+        body = orjson.dumps({
+            'status': 'healthy',
+            'service': 'Karoospikes Webhook Server',
+            'version': '2.1.0',
+            'timestamp': datetime.now().isoformat(),
+            'uptime': 'Running',
+            'bot_token_validation': 'Fixed'
+        })
+        _health_cache[:] = [now, body]
+    return Response(body, mimetype='application/json')
+
+# Static response bodies - serialized once at import time
+_STARTED_AT = datetime.now().isoformat()
+
+_TEST_JSON = orjson.dumps({
+    'status': 'success',
+    'message': 'Karoospikes Webhook Server is operational!',
+    'endpoints': {
+        'POST /signal': 'Main webhook for trading signals',
+        'GET /health': 'Health check endpoint',
+        'GET /test': 'This test endpoint',
+        'GET /': 'API documentation'
+    },
+    'started_at': _STARTED_AT,
+    'github_deployed': True,
+    'version': '2.1.0'
+})
 
 @app.route('/test', methods=['GET', 'POST'])
 def test_endpoint():
     """Test endpoint for debugging and validation"""
     if request.method == 'GET':
-        return jsonify({
-            'status': 'success',
-            'message': 'Karoospikes Webhook Server is operational!',
-            'endpoints': {
-                'POST /signal': 'Main webhook for trading signals',
-                'GET /health': 'Health check endpoint',
-                'GET /test': 'This test endpoint',
-                'GET /': 'API documentation'
-            },
-            'timestamp': datetime.now().isoformat(),
-            'github_deployed': True,
-            'version': '2.1.0'
-        })
+        return Response(_TEST_JSON, mimetype='application/json')
     
     # Handle POST request for testing
     try:
         data = request.get_json() or {}
-        logger.info(f"🧪 Test signal received: {json.dumps(data, indent=2)}")
+        logger.debug("Test signal received: %s", data)
         return jsonify({
             'status': 'success',
             'message': 'Test signal received successfully',
             'received_data': data,
             'timestamp': datetime.now().isoformat()
         })
+    except RequestEntityTooLarge:
+        raise  # Answered by the 413 handler
     except Exception as e:
         return jsonify({
             'status': 'error',
             'message': f'Test failed: {str(e)}'
         }), 400
 
+_DOC_JSON = orjson.dumps({
+    'service': 'Karoospikes Professional Telegram Webhook Server',
+    'version': '2.1.0',
+    'status': 'operational',
+    'description': 'Professional trading signal delivery system for MT5 to Telegram',
+    'deployment': 'GitHub + Render',
+    'recent_updates': [
+        'Fixed bot token validation',
+        'Improved error handling',
+        'Added detailed logging',
+        'Default chat ID configured'
+    ],
+    'endpoints': {
+        'POST /signal': {
+            'description': 'Main webhook endpoint for trading signals',
+            'content_type': 'application/json',
+            'required_fields': [
+                'signal_type (BUY/SELL)',
+                'symbol',
+                'entry_price',
+                'tp_price',
+                'sl_price',
+                'bot_token'
+            ],
+            'optional_fields': [
+                'confidence',
+                'signal_category',
+                'timestamp',
+                'channel_id'
+            ]
+        },
+        'GET /health': 'Health check endpoint',
+        'GET /test': 'Test endpoint for debugging',
+        'GET /': 'This documentation'
+    },
+    'features': [
+        'Professional signal formatting',
+        'Flexible bot token validation',
+        'Comprehensive error handling',
+        'Auto-retry mechanisms',
+        'Real-time monitoring',
+        'GitHub deployment ready'
+    ],
+    'support': {
+        'telegram': '@KaroospikesSupport',
+        'documentation': 'Available in repository'
+    },
+    'started_at': _STARTED_AT
+})
+
 @app.route('/', methods=['GET'])
 def api_documentation():
     """API documentation and service information"""
-    return jsonify({
-        'service': 'Karoospikes Professional Telegram Webhook Server',
-        'version': '2.1.0',
-        'status': 'operational',
-        'description': 'Professional trading signal delivery system for MT5 to Telegram',
-        'deployment': 'GitHub + Render',
-        'recent_updates': [
-            'Fixed bot token validation',
-            'Improved error handling',
-            'Added detailed logging',
-            'Default chat ID configured'
-        ],
-        'endpoints': {
-            'POST /signal': {
-                'description': 'Main webhook endpoint for trading signals',
-                'content_type': 'application/json',
-                'required_fields': [
-                    'signal_type (BUY/SELL)',
-                    'symbol',
-                    'entry_price',
-                    'tp_price',
-                    'sl_price',
-                    'bot_token'
-                ],
-                'optional_fields': [
-                    'confidence',
-                    'signal_category',
-                    'timestamp',
-                    'channel_id'
-                ]
-            },
-            'GET /health': 'Health check endpoint',
-            'GET /test': 'Test endpoint for debugging',
-            'GET /': 'This documentation'
-        },
-        'features': [
-            'Professional signal formatting',
-            'Flexible bot token validation',
-            'Comprehensive error handling',
-            'Auto-retry mechanisms',
-            'Real-time monitoring',
-            'GitHub deployment ready'
-        ],
-        'support': {
-            'telegram': '@KaroospikesSupport',
-            'documentation': 'Available in repository'
-        },
-        'timestamp': datetime.now().isoformat()
-    })
+    return Response(_DOC_JSON, mimetype='application/json')
 
 # Error handlers for better user experience
+_NOT_FOUND_JSON = orjson.dumps({
+    'status': 'error',
+    'message': 'Endpoint not found',
+    'available_endpoints': ['/signal', '/health', '/test', '/']
+})
+_METHOD_NOT_ALLOWED_JSON = orjson.dumps({
+    'status': 'error',
+    'message': 'Method not allowed'
+})
+_TOO_LARGE_JSON = orjson.dumps({
+    'status': 'error',
+    'message': 'Payload too large'
+})
+_INTERNAL_ERROR_JSON = orjson.dumps({
+    'status': 'error',
+    'message': 'Internal server error'
+})
+
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
-        'status': 'error',
-        'message': 'Endpoint not found',
-        'available_endpoints': ['/signal', '/health', '/test', '/']
-    }), 404
+    return Response(_NOT_FOUND_JSON, status=404, mimetype='application/json')
 
 @app.errorhandler(405)
 def method_not_allowed(error):
-    return jsonify({
-        'status': 'error',
-        'message': 'Method not allowed'
-    }), 405
+    return Response(_METHOD_NOT_ALLOWED_JSON, status=405, mimetype='application/json')
+
+@app.errorhandler(413)
+def payload_too_large(error):
+    return Response(_TOO_LARGE_JSON, status=413, mimetype='application/json')
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
-        'status': 'error',
-        'message': 'Internal server error'
-    }), 500
+    return Response(_INTERNAL_ERROR_JSON, status=500, mimetype='application/json')
 
 if __name__ == '__main__':
     # Get port from environment (Render sets this automatically)
@@ -4,4 +4,4 @@ echo "📡 Port: $PORT"
 echo "🌐 Starting gunicorn server..."
 
 # Start the Flask app with gunicorn
-exec gunicorn --bind 0.0.0.0:$PORT --workers 2 --timeout 30 --keep-alive 2 --max-requests 1000 app:app
\ No newline at end of file
+exec gunicorn --bind 0.0.0.0:$PORT --worker-class gevent --workers 2 --worker-connections 500 --timeout 30 --keep-alive 75 --backlog 2048 --max-requests 1000 app:app
\ No newline at end of file